@@ -7,27 +7,113 @@ import threading
 from mcrcon import MCRcon
 from pathlib import Path
 import platform
-
-def get_start_command(start_script: Path):
+import os
+import json
+import shutil
+import gzip
+import struct
+import zlib
+
+PREFETCH_CHUNK_SIZE = 1024 * 1024
+CDS_DIRECTORY_NAME = ".cds"
+# Blocks around the spawn point kept loaded by the server (the legacy 23x23 spawn chunk area).
+SPAWN_PREFETCH_RADIUS = 176
+
+def get_start_command(start_script: Path, java_args=None):
     """
     Determines the correct command to start the server based on the script file extension.
     Returns the appropriate command or None if unsupported.
+
+    java_args are inserted before -jar and are only used for .jar start scripts.
     """
     script_path = str(start_script)
+    java_args = java_args or []
 
     if platform.system() == "Windows":
         if script_path.endswith(".bat"):
             return ["cmd", "/c", script_path]
         elif script_path.endswith(".jar"):
-            return ["cmd", "/c", f"java -jar {script_path}"]
+            return ["cmd", "/c", subprocess.list2cmdline(["java", *java_args, "-jar", script_path])]
     else:
         if script_path.endswith(".sh"):
             return ["bash", script_path]
         elif script_path.endswith(".jar"):
-            return ["java", "-jar", script_path]
+            return ["java", *java_args, "-jar", script_path]
 
     return None
 
+def prefetch_files(paths):
+    """
+    Asks the OS to pull the given files into the page cache so the server does not block on disk reads.
+    Uses posix_fadvise(WILLNEED) where available, otherwise falls back to reading the files through.
+    Missing or unreadable files are skipped.
+    """
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(PREFETCH_CHUNK_SIZE):
+                        pass
+        except OSError:
+            continue
+
+def read_spawn_position(level_dat_path: Path):
+    """
+    Reads the world spawn X and Z block coordinates from a level.dat file.
+    Only the tags needed are searched for in the uncompressed NBT instead of parsing the whole file.
+    Supports both the SpawnX/SpawnZ tags and the newer spawn compound with a pos int array.
+    Returns (0, 0) if the file is missing or the spawn cannot be found.
+    """
+    try:
+        with gzip.open(level_dat_path, 'rb') as f:
+            data = f.read()
+    except (OSError, EOFError, zlib.error):
+        return 0, 0
+
+    def read_int_tag(name):
+        tag = b"\x03" + struct.pack(">H", len(name)) + name
+        index = data.find(tag)
+        if index == -1 or index + len(tag) + 4 > len(data):
+            return None
+        return struct.unpack_from(">i", data, index + len(tag))[0]
+
+    spawn_x = read_int_tag(b"SpawnX")
+    spawn_z = read_int_tag(b"SpawnZ")
+    if spawn_x is not None and spawn_z is not None:
+        return spawn_x, spawn_z
+
+    spawn_index = data.find(b"\x0a\x00\x05spawn")
+    if spawn_index != -1:
+        pos_tag = b"\x0b\x00\x03pos\x00\x00\x00\x03"
+        pos_index = data.find(pos_tag, spawn_index)
+        if pos_index != -1 and pos_index + len(pos_tag) + 12 <= len(data):
+            spawn_x, _, spawn_z = struct.unpack_from(">iii", data, pos_index + len(pos_tag))
+            return spawn_x, spawn_z
+
+    return 0, 0
+
+def get_cds_fingerprint(jar_path: Path):
+    """
+    Returns a fingerprint of the jar and the Java runtime used to detect when a class-data archive has gone stale.
+    An archive only works with the exact JVM build that wrote it, so a Java upgrade must invalidate it too.
+    Returns None if no java executable is found on the PATH.
+    """
+    java_path = shutil.which("java")
+    if java_path is None:
+        return None
+    java_path = os.path.realpath(java_path)
+    jar_stat = jar_path.stat()
+    java_stat = os.stat(java_path)
+    return {
+        "path": str(jar_path),
+        "size": jar_stat.st_size,
+        "mtime_ns": jar_stat.st_mtime_ns,
+        "java_path": java_path,
+        "java_mtime_ns": java_stat.st_mtime_ns
+    }
+
 class MCServerManagerException(Exception):
     pass
 
@@ -43,7 +129,8 @@ class JavaServerManager:
         connection_timeout=5,
         rcon_port=25575,
         rcon_password="",
-        query_port=25565
+        query_port=25565,
+        fast_start=False
     ):
         """
         Initializes the JavaServerManager instance.
@@ -58,6 +145,7 @@ class JavaServerManager:
         - connection_timeout (int): Timeout in seconds for server status checks.
         - server_port (int): The main Minecraft server port (default: 25565).
         - rcon_port (int or None): The RCON port for remote commands (default: 25575).
+        - fast_start (bool): If True, warms the page cache and uses a class-data sharing archive when starting.
         """
         if isinstance(working_directory, str):
             working_directory = Path(working_directory)
@@ -80,6 +168,9 @@ class JavaServerManager:
         self.rcon_password = rcon_password
         self.query_port = query_port
         self.max_start_seconds = max_start_seconds
+        self.fast_start = fast_start
+        self.last_startup_seconds = None
+        self._startup_process = None
     
     @classmethod
     def from_server_properties(
@@ -120,7 +211,8 @@ class JavaServerManager:
             connection_timeout=kwargs.get("connection_timeout", 5),
             rcon_port=rcon_port,
             rcon_password=rcon_password,
-            query_port=int(kwargs.get("query_port", config.get("query.port", 25565)))
+            query_port=int(kwargs.get("query_port", config.get("query.port", 25565))),
+            fast_start=kwargs.get("fast_start", False)
         )
 
     def __str__(self):
@@ -138,6 +230,8 @@ class JavaServerManager:
             Query Port: {self.query_port}
             Max Start Time (seconds): {self.max_start_seconds}
             Connection Timeout: {self.server.timeout} seconds
+            Fast Start: {self.fast_start}
+            Last Startup Time (seconds): {self.last_startup_seconds if self.last_startup_seconds is not None else 'Not Measured'}
             '''
 
 
@@ -237,19 +331,145 @@ class JavaServerManager:
             self.force_stop()
 
 
+        java_args = self.get_cds_args() if self.fast_start else []
+
         # Windows & Linux support
-        start_command = get_start_command(self.start_script)
+        start_command = get_start_command(self.start_script, java_args)
 
         if start_command is None:
             return False, "Unsupported script type."
 
-        subprocess.Popen(
+        if self.fast_start:
+            # Runs alongside the launch so the JVM finds its files already cached. Collecting the paths happens in the
+            # thread too, so scanning the folders never delays or breaks the launch.
+            threading.Thread(target=lambda: prefetch_files(self.get_prefetch_paths()), daemon=True).start()
+
+        self.last_startup_seconds = None
+        start_time = time.time()
+        process = subprocess.Popen(
             start_command,
             cwd=str(self.working_directory),
             creationflags=subprocess.CREATE_NEW_CONSOLE if platform.system() == "Windows" else 0
         )
+        self._startup_process = process
+        threading.Thread(target=self._measure_startup, args=(process, start_time), daemon=True).start()
 
         return True, "Server started."
+
+    def _measure_startup(self, process, start_time):
+        """
+        Waits for the server started by the given process to respond to pings and records how long it took in last_startup_seconds.
+        Pings are only trusted after the server has been seen offline, so a previous instance still shutting down is not timed.
+        Stops early if the process exits or a newer start() takes over.
+        """
+        seen_offline = False
+        while time.time() - start_time <= self.max_start_seconds:
+            if process.poll() is not None or self._startup_process is not process:
+                return
+            if self.ping() is None:
+                seen_offline = True
+            elif seen_offline:
+                self.last_startup_seconds = time.time() - start_time
+                print(f"[Startup Time] {self.last_startup_seconds:.2f}s (Fast Start: {self.fast_start})")
+                return
+            time.sleep(1)
+
+    def get_level_name(self):
+        """
+        Reads the world folder name from server.properties.
+
+        Returns:
+        - str: The level-name property, or "world" if it is not set.
+        """
+        props_path = self.working_directory / "server.properties"
+        if props_path.exists():
+            with open(props_path, 'r') as f:
+                for line in f:
+                    key, _, value = line.strip().partition("=")
+                    if key.strip() == "level-name" and value.strip():
+                        return value.strip()
+        return "world"
+
+    def get_prefetch_paths(self):
+        """
+        Collects the files read during server startup: the server jar, extracted version jars, libraries, mods,
+        the class-data archive and the region files around the spawn point stored in level.dat.
+
+        Returns:
+        - list of Path: Files to warm in the page cache, most important first.
+        """
+        paths = [self.start_script]
+        # Since 1.18 the vanilla server.jar only bootstraps the real server jar it extracts into versions.
+        for folder in ["versions", "libraries", "mods"]:
+            paths.extend(sorted((self.working_directory / folder).rglob("*.jar")))
+        paths.extend(sorted((self.working_directory / CDS_DIRECTORY_NAME).glob("*.jsa")))
+
+        # Each region file holds 512x512 blocks, so the spawn area may span several of them.
+        level_folder = self.working_directory / self.get_level_name()
+        spawn_x, spawn_z = read_spawn_position(level_folder / "level.dat")
+        region_folder = level_folder / "region"
+        for x in range((spawn_x - SPAWN_PREFETCH_RADIUS) // 512, (spawn_x + SPAWN_PREFETCH_RADIUS) // 512 + 1):
+            for z in range((spawn_z - SPAWN_PREFETCH_RADIUS) // 512, (spawn_z + SPAWN_PREFETCH_RADIUS) // 512 + 1):
+                paths.append(region_folder / f"r.{x}.{z}.mca")
+
+        unique_paths = []
+        for path in paths:
+            if path.is_file() and path not in unique_paths:
+                unique_paths.append(path)
+        return unique_paths
+
+    def get_cds_args(self):
+        """
+        Determines the JVM arguments for AppCDS (application class-data sharing).
+        A valid archive for the current jar and Java runtime is reused. Otherwise, any stale archive is removed and
+        the JVM is asked to write a new one when it next shuts down cleanly.
+
+        Returns:
+        - list of str: JVM arguments, empty if the start script is not a .jar, java is not found or the archive
+          files cannot be managed.
+        """
+        if self.start_script.suffix != ".jar":
+            return []
+
+        cds_directory = self.working_directory / CDS_DIRECTORY_NAME
+        archive_path = cds_directory / f"{self.start_script.stem}.jsa"
+        fingerprint_path = cds_directory / f"{self.start_script.stem}.json"
+        # Describes the archive the JVM was last asked to write. It only becomes the archive's fingerprint once that archive exists.
+        pending_fingerprint_path = cds_directory / f"{self.start_script.stem}.pending.json"
+
+        # CDS is only a speed-up, so any file system error falls back to a normal start.
+        try:
+            fingerprint = get_cds_fingerprint(self.start_script)
+            if fingerprint is None:
+                return []
+
+            if archive_path.is_file() and pending_fingerprint_path.is_file():
+                os.replace(pending_fingerprint_path, fingerprint_path)
+
+            saved_fingerprint = None
+            if fingerprint_path.exists():
+                try:
+                    with open(fingerprint_path, 'r') as f:
+                        saved_fingerprint = json.load(f)
+                except ValueError:
+                    saved_fingerprint = None
+
+            # Older JVMs do not know the archive flags, so they are told to ignore them rather than fail to start.
+            args = ["-XX:+IgnoreUnrecognizedVMOptions"]
+            if archive_path.is_file() and saved_fingerprint == fingerprint:
+                args.append(f"-XX:SharedArchiveFile={archive_path}")
+                return args
+
+            cds_directory.mkdir(exist_ok=True)
+            archive_path.unlink(missing_ok=True)
+            fingerprint_path.unlink(missing_ok=True)
+            with open(pending_fingerprint_path, 'w') as f:
+                json.dump(fingerprint, f)
+        except OSError:
+            return []
+
+        args.append(f"-XX:ArchiveClassesAtExit={archive_path}")
+        return args
     
     def restart(self, force_close=False, save=False):
         """
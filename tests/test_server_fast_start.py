@@ -0,0 +1,108 @@
+import unittest
+import os
+import shutil
+import subprocess
+import tempfile
+import gzip
+from pathlib import Path
+from mc_server_manager import JavaServerManager
+from mc_server_manager.server_manager import get_start_command, read_spawn_position
+
+class TestMinecraftServerFastStart(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Before starting the tests, we initialize the server manager with fast start enabled.
+        """
+        server_working_directory = Path("./server")
+        start_script_path = server_working_directory / "server.jar"
+
+        cls.manager = JavaServerManager.from_server_properties(
+            server_working_directory,
+            start_script_path,
+            fast_start=True
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        After the tests, we remove the class-data archive folder so the server directory is left unchanged.
+        """
+        shutil.rmtree(cls.manager.working_directory / ".cds", ignore_errors=True)
+
+    def test_get_prefetch_paths(self):
+        """
+        Test to verify that the ServerManager lists the startup files to prefetch, starting with the server jar.
+        """
+        paths = self.manager.get_prefetch_paths()
+
+        self.assertEqual(paths[0], self.manager.start_script)
+        self.assertTrue(all(path.is_file() for path in paths))
+
+        # There should be no duplicates
+        self.assertEqual(len(paths), len(set(paths)))
+
+        # The vanilla server keeps its libraries in the libraries folder
+        library_jars = list((self.manager.working_directory / "libraries").rglob("*.jar"))
+        self.assertGreater(len(library_jars), 0)
+        for jar in library_jars:
+            self.assertIn(jar, paths)
+
+        # The vanilla server.jar extracts the real server jar into the versions folder
+        version_jars = list((self.manager.working_directory / "versions").rglob("*.jar"))
+        self.assertGreater(len(version_jars), 0)
+        for jar in version_jars:
+            self.assertIn(jar, paths)
+
+        # The spawn area has been generated, so at least one of its region files should be included
+        region_folder = self.manager.working_directory / self.manager.get_level_name() / "region"
+        region_paths = [path for path in paths if path.parent == region_folder]
+        self.assertGreater(len(region_paths), 0)
+        self.assertTrue(all(path.name.startswith("r.") and path.suffix == ".mca" for path in region_paths))
+
+    def test_get_cds_args(self):
+        """
+        Test to verify that the ServerManager requests a class-data archive, reuses it once it exists
+        and requests a new one when the jar changes.
+        """
+        archive_path = self.manager.working_directory / ".cds" / f"{self.manager.start_script.stem}.jsa"
+        archive_path.unlink(missing_ok=True)
+
+        args = self.manager.get_cds_args()
+        self.assertIn(f"-XX:ArchiveClassesAtExit={archive_path}", args)
+
+        # Simulate the archive being written on a clean shutdown
+        archive_path.touch()
+        args = self.manager.get_cds_args()
+        self.assertIn(f"-XX:SharedArchiveFile={archive_path}", args)
+
+        # Changing the jar should invalidate the archive
+        jar_stat = self.manager.start_script.stat()
+        os.utime(self.manager.start_script, ns=(jar_stat.st_atime_ns, jar_stat.st_mtime_ns + 1_000_000_000))
+        try:
+            args = self.manager.get_cds_args()
+        finally:
+            os.utime(self.manager.start_script, ns=(jar_stat.st_atime_ns, jar_stat.st_mtime_ns))
+        self.assertFalse(archive_path.exists())
+        self.assertIn(f"-XX:ArchiveClassesAtExit={archive_path}", args)
+
+        # The JVM arguments must come before -jar
+        command = subprocess.list2cmdline(get_start_command(self.manager.start_script, args))
+        self.assertLess(command.index(args[-1]), command.index("-jar"))
+
+    def test_read_spawn_position_corrupt(self):
+        """
+        Test to verify that a corrupt level.dat falls back to the world origin instead of raising.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            level_dat_path = Path(directory) / "level.dat"
+
+            # A valid gzip header followed by corrupt deflate data, which raises zlib.error when read
+            data = bytearray(gzip.compress(b"\x0a\x00\x00" * 64))
+            data[10] ^= 0xFF
+            level_dat_path.write_bytes(bytes(data))
+            self.assertEqual(read_spawn_position(level_dat_path), (0, 0))
+
+            level_dat_path.write_bytes(b"not a level.dat")
+            self.assertEqual(read_spawn_position(level_dat_path), (0, 0))
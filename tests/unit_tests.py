@@ -3,6 +3,7 @@ import unittest
 from test_server_rcon import TestMinecraftServerRCON
 from test_server_query import TestMinecraftServerQuery
 from test_server_control import TestMinecraftServerControl
+from test_server_fast_start import TestMinecraftServerFastStart
 
 def make_suite():
     """
@@ -31,6 +32,11 @@ def make_suite():
     suite.addTest(TestMinecraftServerControl('test_force_stop'))
     suite.addTest(TestMinecraftServerControl('test_restart_offline'))
 
+    # Then fast start helpers are tested
+    suite.addTest(TestMinecraftServerFastStart('test_get_prefetch_paths'))
+    suite.addTest(TestMinecraftServerFastStart('test_get_cds_args'))
+    suite.addTest(TestMinecraftServerFastStart('test_read_spawn_position_corrupt'))
+
     return suite
 
 def run_all_tests():